@@ -17,6 +17,7 @@
 
 set -e  # Exit on error
 set -u  # Exit on undefined variable
+set -o pipefail  # A failed dump fails the dump | gzip pipeline
 
 # Configuration
 DATE=$(date +%Y%m%d_%H%M%S)
@@ -75,7 +76,7 @@ create_backup_dir() {
 backup_database() {
   log_info "Starting database backup..."
 
-  local BACKUP_FILE="$BACKUP_DIR/backup_$DATE.sql"
+  local BACKUP_FILE="$BACKUP_DIR/backup_$DATE.sql.gz"
 
   # Critical tables to backup
   local TABLES=(
@@ -104,27 +105,20 @@ backup_database() {
     TABLE_ARGS="$TABLE_ARGS -t $table"
   done
 
-  # Create backup
-  if supabase db dump --data-only $TABLE_ARGS > "$BACKUP_FILE" 2>&1; then
+  # Create backup, compressing as the dump streams so the uncompressed SQL
+  # never lands on disk
+  if supabase db dump --data-only $TABLE_ARGS | gzip > "$BACKUP_FILE"; then
     log_info "Backup created successfully: $BACKUP_FILE"
 
     # Get file size
     local SIZE=$(du -h "$BACKUP_FILE" | cut -f1)
     log_info "Backup size: $SIZE"
   else
+    rm -f "$BACKUP_FILE"
     log_error "Backup failed"
     exit 1
   fi
 
-  # Compress backup
-  log_info "Compressing backup..."
-  if gzip -f "$BACKUP_FILE"; then
-    log_info "Backup compressed: ${BACKUP_FILE}.gz"
-    BACKUP_FILE="${BACKUP_FILE}.gz"
-  else
-    log_warn "Compression failed (continuing with uncompressed backup)"
-  fi
-
   echo "$BACKUP_FILE"
 }
 
@@ -8,7 +8,7 @@
  * Usage: node scripts/check-i18n.js
  */
 
-import { readFileSync } from "fs";
+import { readFileSync, writeSync } from "fs";
 import { resolve, dirname } from "path";
 import { fileURLToPath } from "url";
 
@@ -19,6 +19,10 @@ const LOCALES_DIR = resolve(__dirname, "..", "src", "locales");
 const LANGUAGES = ["en", "tr"];
 const NAMESPACES = ["common", "components", "pages"];
 
+// Report lines are collected and written once at the end rather than one
+// console.log (and one stdout write) per key.
+const out = [];
+
 // ── Helpers ──────────────────────────────────────────────────────────
 
 /**
@@ -47,6 +51,8 @@ function loadJson(lang, namespace) {
     const raw = readFileSync(filePath, "utf-8");
     return JSON.parse(raw);
   } catch (err) {
+    // Flush the report so far synchronously; process.exit() would drop a pending write
+    writeSync(1, out.join("\n") + "\n");
     console.error(`  ERROR: Could not read ${filePath}: ${err.message}`);
     process.exit(1);
   }
@@ -57,13 +63,13 @@ function loadJson(lang, namespace) {
 let totalMissing = 0;
 let totalExtra = 0;
 
-console.log("");
-console.log("=".repeat(60));
-console.log("  i18n Translation Parity Check");
-console.log("  Languages: " + LANGUAGES.join(", "));
-console.log("  Namespaces: " + NAMESPACES.join(", "));
-console.log("=".repeat(60));
-console.log("");
+out.push("");
+out.push("=".repeat(60));
+out.push("  i18n Translation Parity Check");
+out.push("  Languages: " + LANGUAGES.join(", "));
+out.push("  Namespaces: " + NAMESPACES.join(", "));
+out.push("=".repeat(60));
+out.push("");
 
 for (const ns of NAMESPACES) {
   const data = {};
@@ -85,44 +91,44 @@ for (const ns of NAMESPACES) {
   const nsMissingCount = missingInB.length + missingInA.length;
 
   if (nsMissingCount === 0) {
-    console.log(`[${ns}] OK -- ${keysA.size} keys, fully in sync`);
+    out.push(`[${ns}] OK -- ${keysA.size} keys, fully in sync`);
   } else {
-    console.log(`[${ns}] MISMATCH`);
+    out.push(`[${ns}] MISMATCH`);
 
     if (missingInB.length > 0) {
-      console.log(`  Missing in ${langB} (present in ${langA}): ${missingInB.length} key(s)`);
+      out.push(`  Missing in ${langB} (present in ${langA}): ${missingInB.length} key(s)`);
       for (const key of missingInB) {
-        console.log(`    - ${key}`);
+        out.push(`    - ${key}`);
       }
       totalMissing += missingInB.length;
     }
 
     if (missingInA.length > 0) {
-      console.log(`  Missing in ${langA} (present in ${langB}): ${missingInA.length} key(s)`);
+      out.push(`  Missing in ${langA} (present in ${langB}): ${missingInA.length} key(s)`);
       for (const key of missingInA) {
-        console.log(`    - ${key}`);
+        out.push(`    - ${key}`);
       }
       totalExtra += missingInA.length;
     }
   }
 
-  console.log("");
+  out.push("");
 }
 
 // ── Summary ──────────────────────────────────────────────────────────
 
-console.log("-".repeat(60));
+out.push("-".repeat(60));
 const total = totalMissing + totalExtra;
 if (total === 0) {
-  console.log("  All translations are in sync. No mismatches found.");
-  console.log("-".repeat(60));
-  console.log("");
-  process.exit(0);
+  out.push("  All translations are in sync. No mismatches found.");
 } else {
-  console.log(`  TOTAL MISMATCHES: ${total}`);
-  console.log(`    Missing in tr: ${totalMissing}`);
-  console.log(`    Missing in en: ${totalExtra}`);
-  console.log("-".repeat(60));
-  console.log("");
-  process.exit(1);
+  out.push(`  TOTAL MISMATCHES: ${total}`);
+  out.push(`    Missing in tr: ${totalMissing}`);
+  out.push(`    Missing in en: ${totalExtra}`);
 }
+out.push("-".repeat(60));
+out.push("");
+
+console.log(out.join("\n"));
+// exitCode (not process.exit) so the write above is flushed before Node exits
+process.exitCode = total === 0 ? 0 : 1;
@@ -8,6 +8,10 @@
 # Usage:
 #   ./scripts/restore-database.sh <backup_file>
 #
+#   Set RESTORE_CONFIRM=yes to skip the confirmation prompt (non-interactive
+#   runs). Without it, a run with no terminal on stdin is cancelled instead
+#   of waiting on the prompt.
+#
 # Example:
 #   ./scripts/restore-database.sh backups/backup_20260215_120000.sql.gz
 #
@@ -68,7 +72,14 @@ log_warn "========================================="
 log_warn "You are about to restore from: $BACKUP_FILE"
 log_warn "This will OVERWRITE existing data!"
 log_warn ""
-read -p "Are you sure you want to continue? (yes/no): " CONFIRM
+if [ -n "${RESTORE_CONFIRM:-}" ]; then
+  CONFIRM="$RESTORE_CONFIRM"
+elif [ -t 0 ]; then
+  read -p "Are you sure you want to continue? (yes/no): " CONFIRM
+else
+  log_warn "No terminal for confirmation and RESTORE_CONFIRM not set"
+  CONFIRM="no"
+fi
 
 if [ "$CONFIRM" != "yes" ]; then
   log_info "Restore cancelled"
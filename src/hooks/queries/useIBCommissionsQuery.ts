@@ -74,10 +74,10 @@ export function useIBCommissionMutations() {
         currency: string
       }
 
-      // Upsert one commission record per type
-      for (const typeResult of result.types) {
+      // Upsert one commission record per type, in a single request
+      if (result.types.length > 0) {
         const { error } = await supabase.from('ib_commissions').upsert(
-          {
+          result.types.map((typeResult) => ({
             organization_id: currentOrg.id,
             ib_partner_id,
             period_start,
@@ -88,7 +88,7 @@ export function useIBCommissionMutations() {
             breakdown: typeResult.breakdown,
             status: 'draft',
             created_by: user?.id ?? null,
-          },
+          })),
           { onConflict: 'idx_ib_commissions_unique_period' },
         )
         if (error) throw error
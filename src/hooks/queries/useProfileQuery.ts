@@ -13,22 +13,22 @@ export function useProfileQuery(userId: string) {
   return useQuery({
     queryKey: queryKeys.profiles.detail(userId),
     queryFn: async (): Promise<ProfileWithMemberships> => {
-      const { data: profile, error: profileError } = await supabase
-        .from('profiles')
-        .select('*')
-        .eq('id', userId)
-        .single()
+      // Both lookups only depend on userId, so fetch them in parallel
+      const [
+        { data: profile, error: profileError },
+        { data: memberships, error: membershipsError },
+      ] = await Promise.all([
+        supabase.from('profiles').select('*').eq('id', userId).single(),
+        supabase
+          .from('organization_members')
+          .select(
+            '*, organization:organizations!organization_members_organization_id_fkey(id, name, slug)',
+          )
+          .eq('user_id', userId),
+      ])
 
       if (profileError) throw profileError
       if (!profile) throw new Error('Profile not found')
-
-      const { data: memberships, error: membershipsError } = await supabase
-        .from('organization_members')
-        .select(
-          '*, organization:organizations!organization_members_organization_id_fkey(id, name, slug)',
-        )
-        .eq('user_id', userId)
-
       if (membershipsError) throw membershipsError
 
       return {
@@ -242,10 +242,12 @@ export function useTransferFix() {
       if (toDelete.length > 0) {
         const ids = toDelete.map((d) => d.systemRow!.id)
         const batches = chunkArray(ids, BATCH_SIZE)
+        // One timestamp for the whole operation, so every batch gets the same deleted_at
+        const deletedAt = new Date().toISOString()
         for (const batch of batches) {
           const { error } = await supabase
             .from('transfers')
-            .update({ deleted_at: new Date().toISOString(), deleted_by: user.id } as never)
+            .update({ deleted_at: deletedAt, deleted_by: user.id } as never)
             .in('id', batch)
 
           if (error) {
@@ -290,22 +292,29 @@ export function useTransferFix() {
       let done = 0
       let failed = 0
 
-      const batches = chunkArray(toApply, BATCH_SIZE)
-      for (const batch of batches) {
-        // Group by employee_id to batch updates
-        for (const assignment of batch) {
+      // Group by employee_id to batch updates: one request per employee per batch of ids
+      const idsByEmployee = new Map<string, string[]>()
+      for (const assignment of toApply) {
+        const employeeId = assignment.resolvedEmployeeId!
+        const ids = idsByEmployee.get(employeeId)
+        if (ids) ids.push(assignment.transferId)
+        else idsByEmployee.set(employeeId, [assignment.transferId])
+      }
+
+      for (const [employeeId, transferIds] of idsByEmployee) {
+        for (const batch of chunkArray(transferIds, BATCH_SIZE)) {
           const { error } = await supabase
             .from('transfers')
-            .update({ employee_id: assignment.resolvedEmployeeId } as never)
-            .eq('id', assignment.transferId)
+            .update({ employee_id: employeeId } as never)
+            .in('id', batch)
 
           if (error) {
-            failed++
+            failed += batch.length
           } else {
-            done++
+            done += batch.length
           }
+          onProgress(done, toApply.length, failed)
         }
-        onProgress(done, toApply.length, failed)
       }
 
       // Invalidate caches
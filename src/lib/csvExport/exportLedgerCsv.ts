@@ -1,5 +1,12 @@
 import type { AccountingEntry } from '@/lib/database.types'
 
+// Built once and reused for every row; toLocaleString() with options
+// re-resolves the locale data on each call.
+const amountFormatter = new Intl.NumberFormat('tr-TR', {
+  minimumFractionDigits: 2,
+  maximumFractionDigits: 2,
+})
+
 /**
  * Convert ledger entries to CSV format matching the import structure
  */
@@ -18,10 +25,7 @@ export function exportLedgerCsv(entries: AccountingEntry[]): string {
   ]
 
   const rows = entries.map((entry) => {
-    const amount = Number(entry.amount).toLocaleString('tr-TR', {
-      minimumFractionDigits: 2,
-      maximumFractionDigits: 2,
-    })
+    const amount = amountFormatter.format(Number(entry.amount))
 
     // GİREN (IN) or ÇIKAN (OUT)
     const girenAmount = entry.direction === 'in' ? amount : ''
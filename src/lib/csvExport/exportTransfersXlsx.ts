@@ -1,8 +1,9 @@
-import ExcelJS from 'exceljs'
+import type ExcelJS from 'exceljs'
 import { saveAs } from 'file-saver'
 import { supabase } from '@/lib/supabase'
 import { localDayStart, localDayEnd } from '@/lib/date'
 import type { TransferRow } from '@/hooks/useTransfers'
+import { loadWorkbook } from './loadWorkbook'
 
 /* ── Constants ────────────────────────────────────────── */
 
@@ -207,7 +208,7 @@ export async function exportTransfersXlsx(
   dateLabel: string,
   pspNames?: string[],
 ): Promise<void> {
-  const wb = new ExcelJS.Workbook()
+  const wb = await loadWorkbook()
   const ws = wb.addWorksheet('Transferler')
 
   // Column indices (1-based in exceljs)
@@ -1,7 +1,8 @@
-import ExcelJS from 'exceljs'
+import type ExcelJS from 'exceljs'
 import { saveAs } from 'file-saver'
 import type { NormalizedTransfer } from '@/lib/tatumServiceSecure'
 import { isKnownToken } from '@/pages/accounting/WalletTransfersTable'
+import { loadWorkbook } from './loadWorkbook'
 
 /* ── Types ──────────────────────────────────────────────── */
 
@@ -229,7 +230,7 @@ export async function exportWalletTransfersXlsx(
   chain: string,
   dateLabel: string,
 ) {
-  const wb = new ExcelJS.Workbook()
+  const wb = await loadWorkbook()
   wb.creator = 'PipLinePro'
   wb.created = new Date()
 
@@ -320,7 +321,7 @@ export async function exportWalletDailyClosingsXlsx(
   chain: string,
   dateLabel: string,
 ) {
-  const wb = new ExcelJS.Workbook()
+  const wb = await loadWorkbook()
   wb.creator = 'PipLinePro'
   wb.created = new Date()
 
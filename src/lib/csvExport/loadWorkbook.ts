@@ -0,0 +1,12 @@
+import type ExcelJS from 'exceljs'
+
+/**
+ * Create an empty exceljs workbook.
+ *
+ * exceljs is ~1 MB, so it is imported on demand here to keep it out of the
+ * page chunks that only offer an export button.
+ */
+export async function loadWorkbook(): Promise<ExcelJS.Workbook> {
+  const { Workbook } = (await import('exceljs')).default
+  return new Workbook()
+}
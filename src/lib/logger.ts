@@ -18,6 +18,34 @@ const isDevelopment = import.meta.env.DEV
 
 type LogLevel = 'debug' | 'info' | 'warn' | 'error'
 
+const LEVEL_RANK: Record<LogLevel, number> = { debug: 10, info: 20, warn: 30, error: 40 }
+
+const LEVEL_TAG: Record<LogLevel, string> = {
+  debug: '[DEBUG]',
+  info: '[INFO]',
+  warn: '[WARN]',
+  error: '[ERROR]',
+}
+
+// Lowest level that produces output; debug is development-only
+const MIN_LEVEL_RANK = LEVEL_RANK[isDevelopment ? 'debug' : 'info']
+
+// Log bursts usually land within the same millisecond; reuse the formatted
+// timestamp instead of allocating a Date + ISO string for every call.
+let lastTimestampMs = 0
+let lastTimestamp = ''
+
+function isoTimestamp(): string {
+  const now = Date.now()
+  if (now !== lastTimestampMs) {
+    lastTimestampMs = now
+    lastTimestamp = new Date(now).toISOString()
+  }
+  return lastTimestamp
+}
+
+const noop = (): void => {}
+
 interface LoggerInterface {
   debug: (...args: unknown[]) => void
   info: (...args: unknown[]) => void
@@ -26,15 +54,17 @@ interface LoggerInterface {
 }
 
 class Logger implements LoggerInterface {
-  private log(level: LogLevel, ...args: unknown[]): void {
-    const timestamp = new Date().toISOString()
-    const prefix = `[${timestamp}] [${level.toUpperCase()}]`
+  // Takes the caller's rest array as-is so it is not re-spread into a second array
+  private log(level: LogLevel, args: unknown[]): void {
+    // Bail out before building the timestamp/prefix for filtered levels
+    if (LEVEL_RANK[level] < MIN_LEVEL_RANK) return
+
+    const timestamp = isoTimestamp()
+    const prefix = `[${timestamp}] ${LEVEL_TAG[level]}`
 
     switch (level) {
       case 'debug':
-        if (isDevelopment) {
-          console.log(prefix, ...args)
-        }
+        console.log(prefix, ...args)
         break
       case 'info':
         console.info(prefix, ...args)
@@ -56,20 +86,22 @@ class Logger implements LoggerInterface {
     }
   }
 
-  debug(...args: unknown[]): void {
-    this.log('debug', ...args)
-  }
+  // Debug output never reaches production, so bind a no-op there and skip
+  // the call into log() (and the caller's argument array) altogether.
+  readonly debug: (...args: unknown[]) => void = isDevelopment
+    ? (...args) => this.log('debug', args)
+    : noop
 
   info(...args: unknown[]): void {
-    this.log('info', ...args)
+    this.log('info', args)
   }
 
   warn(...args: unknown[]): void {
-    this.log('warn', ...args)
+    this.log('warn', args)
   }
 
   error(...args: unknown[]): void {
-    this.log('error', ...args)
+    this.log('error', args)
   }
 }
 
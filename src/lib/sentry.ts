@@ -2,13 +2,23 @@ import * as Sentry from '@sentry/react'
 
 const dsn = import.meta.env.VITE_SENTRY_DSN
 
+// Fraction of page loads that record a performance trace (0–1). Errors are
+// always reported; only the per-navigation tracing spans are sampled.
+const DEFAULT_TRACES_SAMPLE_RATE = 0.2
+const rawRate = import.meta.env.VITE_SENTRY_TRACES_SAMPLE_RATE
+const configuredRate = rawRate ? Number(rawRate) : NaN
+const tracesSampleRate =
+  Number.isFinite(configuredRate) && configuredRate >= 0 && configuredRate <= 1
+    ? configuredRate
+    : DEFAULT_TRACES_SAMPLE_RATE
+
 if (dsn) {
   Sentry.init({
     dsn,
     environment: import.meta.env.DEV ? 'development' : 'production',
     enabled: !import.meta.env.DEV,
     integrations: [Sentry.browserTracingIntegration(), Sentry.replayIntegration()],
-    tracesSampleRate: 0.2,
+    tracesSampleRate,
     replaysSessionSampleRate: 0,
     replaysOnErrorSampleRate: 1.0,
   })
@@ -48,6 +48,18 @@ function hasCodeAndMessage(err: unknown): err is { message: string; code: string
   )
 }
 
+// Message patterns per category, compiled once. Case-insensitive matching
+// replaces lowercasing every message before a chain of includes() scans.
+const JWT_RE = /jwt/i
+const JWT_STATE_RE = /expired|invalid/i
+const AUTH_RE = /unauthorized/i
+const RLS_RE = /row-level security|new row violates/i
+const RATE_LIMIT_RE = /rate limit|too many requests/i
+const TIMEOUT_RE = /timeout|aborted/i
+const NETWORK_RE = /failed to fetch|networkerror|network request failed|econnrefused|dns/i
+const SERVER_RE = /internal server error|bad gateway|service unavailable/i
+const CLIENT_RE = /bad request|not found|validation|constraint/i
+
 export function classifyError(error: unknown): ClassifiedError {
   const msg =
     error instanceof Error
@@ -56,72 +68,44 @@ export function classifyError(error: unknown): ClassifiedError {
         ? ((error as Record<string, unknown>).message as string)
         : String(error)
   const code = hasCodeAndMessage(error) ? error.code : ''
-  const lower = msg.toLowerCase()
 
   // AUTH — JWT expired or unauthorized
   if (
     code === 'PGRST301' ||
     code === '401' ||
-    (lower.includes('jwt') && (lower.includes('expired') || lower.includes('invalid'))) ||
-    lower.includes('unauthorized')
+    (JWT_RE.test(msg) && JWT_STATE_RE.test(msg)) ||
+    AUTH_RE.test(msg)
   ) {
     return new ClassifiedError('AUTH', msg, true, error)
   }
 
   // RLS — row-level security policy violation
-  if (
-    code === '42501' ||
-    lower.includes('row-level security') ||
-    lower.includes('new row violates')
-  ) {
+  if (code === '42501' || RLS_RE.test(msg)) {
     return new ClassifiedError('RLS', msg, false, error)
   }
 
   // RATE_LIMIT — 429
-  if (code === '429' || lower.includes('rate limit') || lower.includes('too many requests')) {
+  if (code === '429' || RATE_LIMIT_RE.test(msg)) {
     return new ClassifiedError('RATE_LIMIT', msg, true, error)
   }
 
   // TIMEOUT — query canceled or statement timeout
-  if (
-    code === '57014' ||
-    lower.includes('timeout') ||
-    lower.includes('statement timeout') ||
-    lower.includes('aborted')
-  ) {
+  if (code === '57014' || TIMEOUT_RE.test(msg)) {
     return new ClassifiedError('TIMEOUT', msg, true, error)
   }
 
   // NETWORK — fetch failures, DNS, connection refused
-  if (
-    error instanceof TypeError ||
-    lower.includes('failed to fetch') ||
-    lower.includes('networkerror') ||
-    lower.includes('network request failed') ||
-    lower.includes('econnrefused') ||
-    lower.includes('dns')
-  ) {
+  if (error instanceof TypeError || NETWORK_RE.test(msg)) {
     return new ClassifiedError('NETWORK', msg, true, error)
   }
 
   // SERVER — 5xx
-  if (
-    code.startsWith('5') ||
-    lower.includes('internal server error') ||
-    lower.includes('bad gateway') ||
-    lower.includes('service unavailable')
-  ) {
+  if (code.startsWith('5') || SERVER_RE.test(msg)) {
     return new ClassifiedError('SERVER', msg, true, error)
   }
 
   // CLIENT — non-retryable 4xx (excluding auth/rls/rate-limit handled above)
-  if (
-    (code.startsWith('4') && !['401', '403', '429'].includes(code)) ||
-    lower.includes('bad request') ||
-    lower.includes('not found') ||
-    lower.includes('validation') ||
-    lower.includes('constraint')
-  ) {
+  if ((code.startsWith('4') && !['401', '403', '429'].includes(code)) || CLIENT_RE.test(msg)) {
     return new ClassifiedError('CLIENT', msg, false, error)
   }
 
@@ -65,6 +65,15 @@ type RememberedAccountingFields = Pick<
 
 const ACCOUNTING_PREFS_KEY = 'piplinepro:accounting-form-prefs'
 
+const amountFormatters = {
+  tr: new Intl.NumberFormat('tr-TR', { minimumFractionDigits: 2, maximumFractionDigits: 2 }),
+  en: new Intl.NumberFormat('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 }),
+}
+
+function formatAmountPreview(n: number, lang: string) {
+  return (lang === 'tr' ? amountFormatters.tr : amountFormatters.en).format(n)
+}
+
 const AUTO_DESCRIPTIONS: Record<Exclude<EntryFormValues['description_preset'], 'diger'>, string> = {
   maas_avans: 'Maaş Avans Ödemesi',
   prim_avans: 'Prim Avans Ödemesi',
@@ -1302,10 +1311,7 @@ export function AccountingEntryFormContent({ entry, onDone }: AccountingEntryFor
               />
               {rawAmount > 0 && (
                 <p className="mt-1 text-xs tabular-nums text-black/40">
-                  {rawAmount.toLocaleString(lang === 'tr' ? 'tr-TR' : 'en-US', {
-                    minimumFractionDigits: 2,
-                    maximumFractionDigits: 2,
-                  })}{' '}
+                  {formatAmountPreview(rawAmount, lang)}{' '}
                   {currency}
                   {' · '}
                   <span className={direction === 'in' ? 'text-green-600' : 'text-red-600'}>
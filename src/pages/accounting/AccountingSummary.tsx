@@ -38,11 +38,13 @@ function formatPeriodLabel(ym: string, lang: string) {
   })
 }
 
+const numberFormatter = new Intl.NumberFormat('tr-TR', {
+  minimumFractionDigits: 2,
+  maximumFractionDigits: 2,
+})
+
 function fmt(n: number) {
-  return n.toLocaleString('tr-TR', {
-    minimumFractionDigits: 2,
-    maximumFractionDigits: 2,
-  })
+  return numberFormatter.format(n)
 }
 
 /* ── DEVİR Edit Popover ──────────────────────────────── */
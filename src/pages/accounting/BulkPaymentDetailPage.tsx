@@ -31,11 +31,13 @@ import {
 
 /* ── Helpers ─────────────────────────────────────────── */
 
+const numberFormatter = new Intl.NumberFormat('tr-TR', {
+  minimumFractionDigits: 2,
+  maximumFractionDigits: 2,
+})
+
 function formatNumber(n: number) {
-  return n.toLocaleString('tr-TR', {
-    minimumFractionDigits: 2,
-    maximumFractionDigits: 2,
-  })
+  return numberFormatter.format(n)
 }
 
 const BATCH_TYPE_LABELS: Record<
@@ -14,11 +14,13 @@ const PALETTE = [
   'bg-pink',
 ]
 
+const numberFormatter = new Intl.NumberFormat('tr-TR', {
+  minimumFractionDigits: 2,
+  maximumFractionDigits: 2,
+})
+
 function formatCurrency(n: number) {
-  return n.toLocaleString('tr-TR', {
-    minimumFractionDigits: 2,
-    maximumFractionDigits: 2,
-  })
+  return numberFormatter.format(n)
 }
 
 interface CategoryBreakdownProps {
@@ -100,11 +100,13 @@ function computeDaySummary(entries: AccountingEntry[]): DaySummary {
 
 /* ── Helpers ─────────────────────────────────────────── */
 
+const numberFormatters = {
+  tr: new Intl.NumberFormat('tr-TR', { minimumFractionDigits: 2, maximumFractionDigits: 2 }),
+  en: new Intl.NumberFormat('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 }),
+}
+
 function formatNumber(n: number, lang: string) {
-  return n.toLocaleString(lang === 'tr' ? 'tr-TR' : 'en-US', {
-    minimumFractionDigits: 2,
-    maximumFractionDigits: 2,
-  })
+  return (lang === 'tr' ? numberFormatters.tr : numberFormatters.en).format(n)
 }
 
 const CURRENCY_SYMBOLS: Record<string, string> = {
@@ -32,6 +32,15 @@ const STEP_KEYS = [
 ] as const
 const STEP_FALLBACKS = ['Upload', 'Preview', 'Results']
 
+const numberFormatter = new Intl.NumberFormat('tr-TR', {
+  minimumFractionDigits: 2,
+  maximumFractionDigits: 2,
+})
+
+function formatAmount(n: number) {
+  return numberFormatter.format(n)
+}
+
 /* ── Props ──────────────────────────────────────────── */
 
 interface LedgerImportDialogProps {
@@ -351,9 +360,6 @@ function StepPreview({
   const filteredRows =
     filter === 'valid' ? validRows : filter === 'errors' ? errorRows : parseResult.rows
 
-  const formatAmount = (n: number) =>
-    n.toLocaleString('tr-TR', { minimumFractionDigits: 2, maximumFractionDigits: 2 })
-
   return (
     <div className="space-y-md">
       {/* Summary cards */}
@@ -441,7 +447,6 @@ function StepPreview({
                 row={row}
                 isExpanded={expandedRow === row.rowIndex}
                 onToggle={() => setExpandedRow(expandedRow === row.rowIndex ? null : row.rowIndex)}
-                formatAmount={formatAmount}
               />
             ))}
           </tbody>
@@ -508,12 +513,10 @@ function PreviewRow({
   row,
   isExpanded,
   onToggle,
-  formatAmount,
 }: {
   row: LedgerParsedRow
   isExpanded: boolean
   onToggle: () => void
-  formatAmount: (n: number) => string
 }) {
   const hasIssues = row.issues.length > 0
 
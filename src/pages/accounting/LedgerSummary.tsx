@@ -3,11 +3,13 @@ import { ArrowDown, ArrowUp, CurrencyDollar, Money, Coins } from '@phosphor-icon
 import type { AccountingSummary } from '@/hooks/queries/useAccountingQuery'
 import { Card, Skeleton } from '@ds'
 
+const numberFormatter = new Intl.NumberFormat('tr-TR', {
+  minimumFractionDigits: 2,
+  maximumFractionDigits: 2,
+})
+
 function formatNumber(n: number) {
-  return n.toLocaleString('tr-TR', {
-    minimumFractionDigits: 2,
-    maximumFractionDigits: 2,
-  })
+  return numberFormatter.format(n)
 }
 
 const REGISTER_CONFIG: Record<
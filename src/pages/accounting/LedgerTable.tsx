@@ -93,11 +93,13 @@ function groupByDate(entries: AccountingEntry[], lang: string): DateGroup[] {
   }))
 }
 
+const numberFormatter = new Intl.NumberFormat('tr-TR', {
+  minimumFractionDigits: 2,
+  maximumFractionDigits: 2,
+})
+
 function formatNumber(n: number) {
-  return n.toLocaleString('tr-TR', {
-    minimumFractionDigits: 2,
-    maximumFractionDigits: 2,
-  })
+  return numberFormatter.format(n)
 }
 
 const REGISTER_LABELS: Record<string, string> = {
@@ -26,11 +26,13 @@ import { Button, Card, Skeleton, Tag, EmptyState } from '@ds'
 
 /* ── Helpers ─────────────────────────────────────────── */
 
+const numberFormatters = {
+  tr: new Intl.NumberFormat('tr-TR', { minimumFractionDigits: 2, maximumFractionDigits: 2 }),
+  en: new Intl.NumberFormat('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 }),
+}
+
 function formatNumber(n: number, lang: string) {
-  return n.toLocaleString(lang === 'tr' ? 'tr-TR' : 'en-US', {
-    minimumFractionDigits: 2,
-    maximumFractionDigits: 2,
-  })
+  return (lang === 'tr' ? numberFormatters.tr : numberFormatters.en).format(n)
 }
 
 const REGISTER_CONFIG: Record<
@@ -16,14 +16,14 @@ function formatShortDate(dateStr: string): string {
   return d.toLocaleDateString('en-US', { month: 'short', day: 'numeric' })
 }
 
+const numberFormatter = new Intl.NumberFormat('en-US', {
+  minimumFractionDigits: 2,
+  maximumFractionDigits: 2,
+})
+const axisFormatter = new Intl.NumberFormat()
+
 function formatUsd(value: number): string {
-  return (
-    '$' +
-    value.toLocaleString('en-US', {
-      minimumFractionDigits: 2,
-      maximumFractionDigits: 2,
-    })
-  )
+  return '$' + numberFormatter.format(value)
 }
 
 interface WalletBalanceChartProps {
@@ -64,7 +64,7 @@ export function WalletBalanceChart({ walletId }: WalletBalanceChartProps) {
               tickLine={false}
             />
             <YAxis
-              tickFormatter={(v: number) => `$${v.toLocaleString()}`}
+              tickFormatter={(v: number) => `$${axisFormatter.format(v)}`}
               tick={{ fontSize: 11, fill: 'rgba(0,0,0,0.4)' }}
               axisLine={false}
               tickLine={false}
@@ -56,11 +56,14 @@ function truncAddr(addr: string) {
   return `${addr.slice(0, 6)}...${addr.slice(-4)}`
 }
 
-function fmt(value: number, decimals = 2): string {
-  return value.toLocaleString('en-US', {
-    minimumFractionDigits: decimals,
-    maximumFractionDigits: decimals,
-  })
+const numberFormatter = new Intl.NumberFormat('en-US', {
+  minimumFractionDigits: 2,
+  maximumFractionDigits: 2,
+})
+const balanceFormatter = new Intl.NumberFormat('en-US', { maximumFractionDigits: 2 })
+
+function fmt(value: number): string {
+  return numberFormatter.format(value)
 }
 
 interface WalletCardProps {
@@ -224,7 +227,7 @@ export function WalletCard({ wallet, onViewDetail, onEdit, onDelete }: WalletCar
                 return (
                   <span key={i} className="text-[10px] text-black/40">
                     <span className="font-mono font-medium tabular-nums text-black/55">
-                      {bal.toLocaleString('en-US', { maximumFractionDigits: 2 })}
+                      {balanceFormatter.format(bal)}
                     </span>{' '}
                     {label}
                   </span>
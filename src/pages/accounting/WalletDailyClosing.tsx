@@ -180,11 +180,13 @@ function computeDailyClosings(
 
 /* ── Helpers ──────────────────────────────────────────── */
 
+const numberFormatter = new Intl.NumberFormat('en-US', {
+  minimumFractionDigits: 2,
+  maximumFractionDigits: 2,
+})
+
 function fmtNum(n: number): string {
-  return n.toLocaleString('en-US', {
-    minimumFractionDigits: 2,
-    maximumFractionDigits: 2,
-  })
+  return numberFormatter.format(n)
 }
 
 const MAX_VISIBLE_TOKENS = 3
@@ -33,11 +33,15 @@ const CHAIN_LABELS: Record<string, string> = {
   solana: 'Solana',
 }
 
+const numberFormatter = new Intl.NumberFormat('en-US', {
+  minimumFractionDigits: 2,
+  maximumFractionDigits: 2,
+})
+const balanceFormatter = new Intl.NumberFormat('en-US', { maximumFractionDigits: 6 })
+const snapshotBalanceFormatter = new Intl.NumberFormat('en-US', { maximumFractionDigits: 4 })
+
 function formatUsd(value: number): string {
-  return value.toLocaleString('en-US', {
-    minimumFractionDigits: 2,
-    maximumFractionDigits: 2,
-  })
+  return numberFormatter.format(value)
 }
 
 interface WalletDetailSheetProps {
@@ -172,7 +176,7 @@ export function WalletDetailSheet({ wallet, onClose }: WalletDetailSheetProps) {
                         </div>
                         <div className="text-right">
                           <p className="font-mono text-sm font-semibold tabular-nums text-black/85">
-                            {bal.toLocaleString('en-US', { maximumFractionDigits: 6 })}
+                            {balanceFormatter.format(bal)}
                           </p>
                           {asset.usdValue > 0 && (
                             <p className="font-mono text-xs tabular-nums text-black/40">
@@ -304,9 +308,7 @@ export function WalletDetailSheet({ wallet, onClose }: WalletDetailSheetProps) {
                                 <div key={i} className="flex items-center gap-2 text-xs">
                                   <span className="text-black/50">{b.token}</span>
                                   <span className="font-mono tabular-nums text-black/70">
-                                    {parseFloat(b.balance).toLocaleString('en-US', {
-                                      maximumFractionDigits: 4,
-                                    })}
+                                    {snapshotBalanceFormatter.format(parseFloat(b.balance))}
                                   </span>
                                 </div>
                               ))}
@@ -84,20 +84,24 @@ function relativeTime(ts: number, lang: string): string {
   return 'just now'
 }
 
+// One formatter per precision used by formatAmount
+const amountFormatters = {
+  2: new Intl.NumberFormat('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 }),
+  4: new Intl.NumberFormat('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 4 }),
+  6: new Intl.NumberFormat('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 6 }),
+}
+
 function formatAmount(amount: string, direction: 'in' | 'out'): string {
   const num = parseFloat(amount)
   if (isNaN(num)) return amount
 
   // Smart formatting: show more decimals for small amounts, fewer for large
-  let maxDecimals = 2
+  let maxDecimals: keyof typeof amountFormatters = 2
   if (num < 0.01) maxDecimals = 6
   else if (num < 1) maxDecimals = 4
   else if (num >= 1000) maxDecimals = 2
 
-  const formatted = num.toLocaleString('en-US', {
-    minimumFractionDigits: 2,
-    maximumFractionDigits: maxDecimals,
-  })
+  const formatted = amountFormatters[maxDecimals].format(num)
 
   return direction === 'in' ? `+${formatted}` : `-${formatted}`
 }
@@ -44,6 +44,11 @@ interface PartnerDetailPanelProps {
   onBack: () => void
 }
 
+const numberFormatter = new Intl.NumberFormat('en-US', {
+  minimumFractionDigits: 2,
+  maximumFractionDigits: 2,
+})
+
 export function PartnerDetailPanel({ partnerId, isAdmin, onBack }: PartnerDetailPanelProps) {
   const { t } = useTranslation('pages')
   const navigate = useNavigate()
@@ -98,8 +103,7 @@ export function PartnerDetailPanel({ partnerId, isAdmin, onBack }: PartnerDetail
   const tierVariant = getTierVariant(tier)
   const balance = totalEarned - totalPaid
 
-  const fmt = (n: number) =>
-    new Intl.NumberFormat('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 }).format(n)
+  const fmt = (n: number) => numberFormatter.format(n)
 
   const fmtDate = (d: string) =>
     new Date(d).toLocaleDateString('en-US', { year: 'numeric', month: 'short', day: 'numeric' })
@@ -5,6 +5,7 @@ interface ImportMetaEnv {
   readonly VITE_SUPABASE_URL: string
   readonly VITE_SUPABASE_ANON_KEY: string
   readonly VITE_SENTRY_DSN?: string
+  readonly VITE_SENTRY_TRACES_SAMPLE_RATE?: string
   readonly VITE_HCAPTCHA_SITE_KEY?: string
   readonly VITE_EXCHANGE_RATE_API_KEY?: string
 }
@@ -1,9 +1,16 @@
-import { createClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import { createClient, type SupabaseClient } from 'https://esm.sh/@supabase/supabase-js@2'
+
+// The service-role client holds no session (persistSession/autoRefreshToken
+// are off), so one instance per isolate is safe to share across requests.
+let cachedAdminClient: SupabaseClient | null = null
 
 export function createAdminClient() {
-  return createClient(
-    Deno.env.get('SUPABASE_URL')!,
-    Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!,
-    { auth: { autoRefreshToken: false, persistSession: false } },
-  )
+  if (!cachedAdminClient) {
+    cachedAdminClient = createClient(
+      Deno.env.get('SUPABASE_URL')!,
+      Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!,
+      { auth: { autoRefreshToken: false, persistSession: false } },
+    )
+  }
+  return cachedAdminClient
 }
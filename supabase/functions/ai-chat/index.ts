@@ -5,6 +5,9 @@ import { createAdminClient } from '../_shared/supabase-admin.ts'
 import { z, parseBody } from '../_shared/validation.ts'
 import { checkRateLimit } from '../_shared/rateLimit.ts'
 
+const SUPABASE_URL = Deno.env.get('SUPABASE_URL')!
+const SUPABASE_ANON_KEY = Deno.env.get('SUPABASE_ANON_KEY')!
+
 /* ── Input schema ──────────────────────────────────────────────── */
 
 const AiChatBodySchema = z.object({
@@ -733,11 +736,9 @@ serve(async (req: Request) => {
     const authHeader = req.headers.get('Authorization')
     if (!authHeader) return jsonErr(401, 'UNAUTHORIZED')
 
-    const anonClient = createClient(
-      Deno.env.get('SUPABASE_URL')!,
-      Deno.env.get('SUPABASE_ANON_KEY')!,
-      { global: { headers: { Authorization: authHeader } } },
-    )
+    const anonClient = createClient(SUPABASE_URL, SUPABASE_ANON_KEY, {
+      global: { headers: { Authorization: authHeader } },
+    })
 
     const {
       data: { user },
@@ -1,5 +1,5 @@
 import 'jsr:@supabase/functions-js/edge-runtime.d.ts'
-import { createClient } from 'jsr:@supabase/supabase-js@2'
+import { createClient, type SupabaseClient } from 'jsr:@supabase/supabase-js@2'
 
 const corsHeaders = {
   'Access-Control-Allow-Origin': '*',
@@ -15,15 +15,27 @@ async function sha256hex(input: string): Promise<string> {
     .join('')
 }
 
+let cachedAdminClient: SupabaseClient | null = null
+
+// Service-role client without a session, so one instance per isolate is
+// safe to share across requests
+function createAdminClient() {
+  if (!cachedAdminClient) {
+    cachedAdminClient = createClient(
+      Deno.env.get('SUPABASE_URL')!,
+      Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!,
+      { auth: { autoRefreshToken: false, persistSession: false } },
+    )
+  }
+  return cachedAdminClient
+}
+
 Deno.serve(async (req: Request) => {
   if (req.method === 'OPTIONS') {
     return new Response('ok', { headers: corsHeaders })
   }
 
-  const supabase = createClient(
-    Deno.env.get('SUPABASE_URL')!,
-    Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!,
-  )
+  const supabase = createAdminClient()
 
   // Extract API key from Authorization header
   const authHeader = req.headers.get('Authorization') ?? ''
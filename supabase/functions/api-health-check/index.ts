@@ -10,6 +10,9 @@ import { createAdminClient } from '../_shared/supabase-admin.ts'
  * God-only access — reveals which API keys are configured and their masked values.
  * ─────────────────────────────────────────────────────────────────── */
 
+const SUPABASE_URL = Deno.env.get('SUPABASE_URL')!
+const SUPABASE_ANON_KEY = Deno.env.get('SUPABASE_ANON_KEY')!
+
 /* ── Response helpers ──────────────────────────────────────────────── */
 
 function jsonResponse(body: unknown, status = 200, origin?: string): Response {
@@ -31,6 +34,11 @@ function maskKey(key: string | undefined): string | undefined {
   return '****' + key.slice(-4)
 }
 
+/** Whole milliseconds since `start`, a performance.now() reading (monotonic clock). */
+function elapsedMs(start: number): number {
+  return Math.round(performance.now() - start)
+}
+
 function classifyError(statusCode: number): string {
   if (statusCode === 401 || statusCode === 403) return 'invalid_key'
   if (statusCode === 429) return 'rate_limit'
@@ -60,50 +68,61 @@ const UNIPAYMENT_CLIENT_ID = Deno.env.get('UNIPAYMENT_CLIENT_ID')
 const UNIPAYMENT_CLIENT_SECRET = Deno.env.get('UNIPAYMENT_CLIENT_SECRET')
 const UNIPAYMENT_BASE_URL = Deno.env.get('UNIPAYMENT_BASE_URL') || 'https://api.unipayment.io'
 
-async function checkTatum(): Promise<HealthResult> {
-  const now = new Date().toISOString()
+// Probe URLs are fixed per isolate (keys come from the environment)
+const TATUM_CHECK_URL = 'https://api.tatum.io/v4/data/rate/symbol?symbol=BTC&basePair=USD'
+const EXCHANGE_RATE_CHECK_URL = `https://api.freecurrencyapi.com/v1/latest?apikey=${EXCHANGE_RATE_API_KEY}&base_currency=USD&currencies=TRY`
+const RESEND_CHECK_URL = 'https://api.resend.com/api-keys'
+const UNIPAYMENT_TOKEN_URL = `${UNIPAYMENT_BASE_URL}/connect/token`
+
+// Checks run in parallel, so one hung provider would otherwise hold the whole response
+const CHECK_TIMEOUT_MS = 10_000
+
+async function checkTatum(now: string): Promise<HealthResult> {
   if (!TATUM_API_KEY) {
     return { service: 'tatum', status: 'not_configured', errorType: 'not_configured', responseTimeMs: 0, keyConfigured: false, checkedAt: now }
   }
-  const start = Date.now()
+  const start = performance.now()
   try {
-    const res = await fetch('https://api.tatum.io/v4/data/rate/symbol?symbol=BTC&basePair=USD', {
+    const res = await fetch(TATUM_CHECK_URL, {
       headers: { accept: 'application/json', 'x-api-key': TATUM_API_KEY },
+      signal: AbortSignal.timeout(CHECK_TIMEOUT_MS),
     })
-    const ms = Date.now() - start
+    const ms = elapsedMs(start)
     if (res.ok) {
+      // Only the status matters; release the connection without reading the body
+      await res.body?.cancel()
       return { service: 'tatum', status: 'healthy', statusCode: res.status, responseTimeMs: ms, keyConfigured: true, keyMasked: maskKey(TATUM_API_KEY), checkedAt: now }
     }
     const errText = await res.text().catch(() => '')
     return { service: 'tatum', status: 'error', statusCode: res.status, errorType: classifyError(res.status), errorMessage: errText.slice(0, 200), responseTimeMs: ms, keyConfigured: true, keyMasked: maskKey(TATUM_API_KEY), checkedAt: now }
   } catch (err) {
-    return { service: 'tatum', status: 'error', errorType: 'network_error', errorMessage: (err as Error).message, responseTimeMs: Date.now() - start, keyConfigured: true, keyMasked: maskKey(TATUM_API_KEY), checkedAt: now }
+    return { service: 'tatum', status: 'error', errorType: 'network_error', errorMessage: (err as Error).message, responseTimeMs: elapsedMs(start), keyConfigured: true, keyMasked: maskKey(TATUM_API_KEY), checkedAt: now }
   }
 }
 
-async function checkExchangeRate(): Promise<HealthResult> {
-  const now = new Date().toISOString()
+async function checkExchangeRate(now: string): Promise<HealthResult> {
   if (!EXCHANGE_RATE_API_KEY) {
     return { service: 'exchangeRate', status: 'not_configured', errorType: 'not_configured', responseTimeMs: 0, keyConfigured: false, checkedAt: now }
   }
-  const start = Date.now()
+  const start = performance.now()
   try {
-    const res = await fetch(`https://api.freecurrencyapi.com/v1/latest?apikey=${EXCHANGE_RATE_API_KEY}&base_currency=USD&currencies=TRY`, {
+    const res = await fetch(EXCHANGE_RATE_CHECK_URL, {
       headers: { accept: 'application/json' },
+      signal: AbortSignal.timeout(CHECK_TIMEOUT_MS),
     })
-    const ms = Date.now() - start
+    const ms = elapsedMs(start)
     if (res.ok) {
+      await res.body?.cancel()
       return { service: 'exchangeRate', status: 'healthy', statusCode: res.status, responseTimeMs: ms, keyConfigured: true, keyMasked: maskKey(EXCHANGE_RATE_API_KEY), checkedAt: now }
     }
     const errText = await res.text().catch(() => '')
     return { service: 'exchangeRate', status: 'error', statusCode: res.status, errorType: classifyError(res.status), errorMessage: errText.slice(0, 200), responseTimeMs: ms, keyConfigured: true, keyMasked: maskKey(EXCHANGE_RATE_API_KEY), checkedAt: now }
   } catch (err) {
-    return { service: 'exchangeRate', status: 'error', errorType: 'network_error', errorMessage: (err as Error).message, responseTimeMs: Date.now() - start, keyConfigured: true, keyMasked: maskKey(EXCHANGE_RATE_API_KEY), checkedAt: now }
+    return { service: 'exchangeRate', status: 'error', errorType: 'network_error', errorMessage: (err as Error).message, responseTimeMs: elapsedMs(start), keyConfigured: true, keyMasked: maskKey(EXCHANGE_RATE_API_KEY), checkedAt: now }
   }
 }
 
-function checkGemini(): HealthResult {
-  const now = new Date().toISOString()
+function checkGemini(now: string): HealthResult {
   // Gemini: only check if key is configured (actual API calls cost money)
   if (!GEMINI_API_KEY) {
     return { service: 'gemini', status: 'not_configured', errorType: 'not_configured', responseTimeMs: 0, keyConfigured: false, checkedAt: now }
@@ -111,35 +130,35 @@ function checkGemini(): HealthResult {
   return { service: 'gemini', status: 'healthy', responseTimeMs: 0, keyConfigured: true, keyMasked: maskKey(GEMINI_API_KEY), checkedAt: now }
 }
 
-async function checkResend(): Promise<HealthResult> {
-  const now = new Date().toISOString()
+async function checkResend(now: string): Promise<HealthResult> {
   if (!RESEND_API_KEY) {
     return { service: 'resend', status: 'not_configured', errorType: 'not_configured', responseTimeMs: 0, keyConfigured: false, checkedAt: now }
   }
-  const start = Date.now()
+  const start = performance.now()
   try {
-    const res = await fetch('https://api.resend.com/api-keys', {
+    const res = await fetch(RESEND_CHECK_URL, {
       headers: { Authorization: `Bearer ${RESEND_API_KEY}` },
+      signal: AbortSignal.timeout(CHECK_TIMEOUT_MS),
     })
-    const ms = Date.now() - start
+    const ms = elapsedMs(start)
     if (res.ok) {
+      await res.body?.cancel()
       return { service: 'resend', status: 'healthy', statusCode: res.status, responseTimeMs: ms, keyConfigured: true, keyMasked: maskKey(RESEND_API_KEY), checkedAt: now }
     }
     const errText = await res.text().catch(() => '')
     return { service: 'resend', status: 'error', statusCode: res.status, errorType: classifyError(res.status), errorMessage: errText.slice(0, 200), responseTimeMs: ms, keyConfigured: true, keyMasked: maskKey(RESEND_API_KEY), checkedAt: now }
   } catch (err) {
-    return { service: 'resend', status: 'error', errorType: 'network_error', errorMessage: (err as Error).message, responseTimeMs: Date.now() - start, keyConfigured: true, keyMasked: maskKey(RESEND_API_KEY), checkedAt: now }
+    return { service: 'resend', status: 'error', errorType: 'network_error', errorMessage: (err as Error).message, responseTimeMs: elapsedMs(start), keyConfigured: true, keyMasked: maskKey(RESEND_API_KEY), checkedAt: now }
   }
 }
 
-async function checkUniPayment(): Promise<HealthResult> {
-  const now = new Date().toISOString()
+async function checkUniPayment(now: string): Promise<HealthResult> {
   if (!UNIPAYMENT_CLIENT_ID || !UNIPAYMENT_CLIENT_SECRET) {
     return { service: 'uniPayment', status: 'not_configured', errorType: 'not_configured', responseTimeMs: 0, keyConfigured: false, checkedAt: now }
   }
-  const start = Date.now()
+  const start = performance.now()
   try {
-    const res = await fetch(`${UNIPAYMENT_BASE_URL}/connect/token`, {
+    const res = await fetch(UNIPAYMENT_TOKEN_URL, {
       method: 'POST',
       headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
       body: new URLSearchParams({
@@ -147,15 +166,17 @@ async function checkUniPayment(): Promise<HealthResult> {
         client_id: UNIPAYMENT_CLIENT_ID,
         client_secret: UNIPAYMENT_CLIENT_SECRET,
       }),
+      signal: AbortSignal.timeout(CHECK_TIMEOUT_MS),
     })
-    const ms = Date.now() - start
+    const ms = elapsedMs(start)
     if (res.ok) {
+      await res.body?.cancel()
       return { service: 'uniPayment', status: 'healthy', statusCode: res.status, responseTimeMs: ms, keyConfigured: true, keyMasked: maskKey(UNIPAYMENT_CLIENT_ID), checkedAt: now }
     }
     const errText = await res.text().catch(() => '')
     return { service: 'uniPayment', status: 'error', statusCode: res.status, errorType: classifyError(res.status), errorMessage: errText.slice(0, 200), responseTimeMs: ms, keyConfigured: true, keyMasked: maskKey(UNIPAYMENT_CLIENT_ID), checkedAt: now }
   } catch (err) {
-    return { service: 'uniPayment', status: 'error', errorType: 'network_error', errorMessage: (err as Error).message, responseTimeMs: Date.now() - start, keyConfigured: true, keyMasked: maskKey(UNIPAYMENT_CLIENT_ID), checkedAt: now }
+    return { service: 'uniPayment', status: 'error', errorType: 'network_error', errorMessage: (err as Error).message, responseTimeMs: elapsedMs(start), keyConfigured: true, keyMasked: maskKey(UNIPAYMENT_CLIENT_ID), checkedAt: now }
   }
 }
 
@@ -165,11 +186,9 @@ async function validateGodUser(authHeader: string | null): Promise<string> {
   if (!authHeader) throw new Error('Missing authorization header')
 
   const token = authHeader.replace('Bearer ', '')
-  const supabase = createClient(
-    Deno.env.get('SUPABASE_URL')!,
-    Deno.env.get('SUPABASE_ANON_KEY')!,
-    { global: { headers: { Authorization: authHeader } } },
-  )
+  const supabase = createClient(SUPABASE_URL, SUPABASE_ANON_KEY, {
+    global: { headers: { Authorization: authHeader } },
+  })
 
   const { data: { user }, error } = await supabase.auth.getUser(token)
   if (error || !user) throw new Error('Unauthorized: invalid token')
@@ -199,13 +218,14 @@ serve(async (req: Request) => {
   try {
     await validateGodUser(req.headers.get('authorization'))
 
-    // Run all checks in parallel
+    // Run all checks in parallel, stamped with a single check time
+    const now = new Date().toISOString()
     const results = await Promise.all([
-      checkTatum(),
-      checkExchangeRate(),
-      checkGemini(),
-      checkResend(),
-      checkUniPayment(),
+      checkTatum(now),
+      checkExchangeRate(now),
+      checkGemini(now),
+      checkResend(now),
+      checkUniPayment(now),
     ])
 
     return jsonResponse(results, 200, origin)
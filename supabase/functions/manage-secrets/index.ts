@@ -12,6 +12,8 @@ import { checkRateLimit } from '../_shared/rateLimit.ts'
  * Requires SB_MANAGEMENT_TOKEN (Personal Access Token) to be set.
  * ─────────────────────────────────────────────────────────────────── */
 
+const SUPABASE_URL = Deno.env.get('SUPABASE_URL')!
+const SUPABASE_ANON_KEY = Deno.env.get('SUPABASE_ANON_KEY')!
 const PROJECT_REF = 'mnbjpcidjawvygkimgma'
 const SB_MANAGEMENT_TOKEN = Deno.env.get('SB_MANAGEMENT_TOKEN')
 
@@ -71,7 +73,7 @@ async function validateGodUser(authHeader: string | null): Promise<GodUser> {
   if (!authHeader) throw new Error('Missing authorization header')
 
   const token = authHeader.replace('Bearer ', '')
-  const supabase = createClient(Deno.env.get('SUPABASE_URL')!, Deno.env.get('SUPABASE_ANON_KEY')!, {
+  const supabase = createClient(SUPABASE_URL, SUPABASE_ANON_KEY, {
     global: { headers: { Authorization: authHeader } },
   })
 
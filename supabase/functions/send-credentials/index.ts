@@ -1,8 +1,11 @@
 import { serve } from 'https://deno.land/std@0.177.0/http/server.ts'
-import { createClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import { createClient, type SupabaseClient } from 'https://esm.sh/@supabase/supabase-js@2'
 import { z, parseBody } from '../_shared/validation.ts'
 import { checkRateLimit } from '../_shared/rateLimit.ts'
 
+const SUPABASE_URL = Deno.env.get('SUPABASE_URL')!
+const SUPABASE_ANON_KEY = Deno.env.get('SUPABASE_ANON_KEY')!
+
 /* ------------------------------------------------------------------ */
 /*  Inlined shared utilities                                           */
 /* ------------------------------------------------------------------ */
@@ -28,10 +31,17 @@ function handleCors(req: Request): Response | null {
   return null
 }
 
+let cachedAdminClient: SupabaseClient | null = null
+
 function createAdminClient() {
-  return createClient(Deno.env.get('SUPABASE_URL')!, Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!, {
-    auth: { autoRefreshToken: false, persistSession: false },
-  })
+  if (!cachedAdminClient) {
+    cachedAdminClient = createClient(
+      SUPABASE_URL,
+      Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!,
+      { auth: { autoRefreshToken: false, persistSession: false } },
+    )
+  }
+  return cachedAdminClient
 }
 
 /* ------------------------------------------------------------------ */
@@ -145,11 +155,9 @@ serve(async (req: Request) => {
       return errorResponse(401, 'UNAUTHORIZED', 'Missing authorization header', origin)
     }
 
-    const anonClient = createClient(
-      Deno.env.get('SUPABASE_URL')!,
-      Deno.env.get('SUPABASE_ANON_KEY')!,
-      { global: { headers: { Authorization: authHeader } } },
-    )
+    const anonClient = createClient(SUPABASE_URL, SUPABASE_ANON_KEY, {
+      global: { headers: { Authorization: authHeader } },
+    })
     const {
       data: { user: caller },
       error: authError,
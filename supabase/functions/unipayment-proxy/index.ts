@@ -13,6 +13,8 @@ import { z, parseBody } from '../_shared/validation.ts'
  * - Supports: wallet, invoices, payments, and transaction sync
  * ─────────────────────────────────────────────────────────────────── */
 
+const SUPABASE_URL = Deno.env.get('SUPABASE_URL')!
+const SUPABASE_ANON_KEY = Deno.env.get('SUPABASE_ANON_KEY')!
 const UNIPAYMENT_CLIENT_ID = Deno.env.get('UNIPAYMENT_CLIENT_ID')
 const UNIPAYMENT_CLIENT_SECRET = Deno.env.get('UNIPAYMENT_CLIENT_SECRET')
 const UNIPAYMENT_BASE_URL = Deno.env.get('UNIPAYMENT_BASE_URL') || 'https://api.unipayment.io'
@@ -138,7 +140,7 @@ interface CallerInfo {
 async function validateCaller(authHeader: string | null, orgId: string): Promise<CallerInfo> {
   if (!authHeader) throw new Error('Missing authorization header')
 
-  const supabase = createClient(Deno.env.get('SUPABASE_URL')!, Deno.env.get('SUPABASE_ANON_KEY')!, {
+  const supabase = createClient(SUPABASE_URL, SUPABASE_ANON_KEY, {
     global: { headers: { Authorization: authHeader } },
   })
 
@@ -0,0 +1,19 @@
+-- ============================================================================
+-- 146: Drop single-column indexes covered by composite indexes
+--
+-- Each index below is an exact leading-column prefix of a composite index on
+-- the same table. Postgres serves equality/range lookups on that column (and
+-- FK cascade checks) from the composite, so the single-column copy only adds
+-- one more B-tree insert per row write and duplicate storage.
+--
+--   Dropped                               Covered by
+--   idx_transfers_org                     idx_transfers_org_date                (008)
+--   idx_audit_org                         idx_transfer_audit_log_org_date       (085)
+--   idx_login_attempts_device_id          idx_login_attempts_device_created     (023)
+--   idx_captcha_challenges_device_id      idx_captcha_challenges_device_solved  (024)
+-- ============================================================================
+
+DROP INDEX IF EXISTS public.idx_transfers_org;
+DROP INDEX IF EXISTS public.idx_audit_org;
+DROP INDEX IF EXISTS public.idx_login_attempts_device_id;
+DROP INDEX IF EXISTS public.idx_captcha_challenges_device_id;